@@ -12,14 +12,141 @@ and builds a hierarchical metadata catalog with four layers:
 It demonstrates how to traverse the lineage and query the hierarchy.
 """
 
+import hashlib
 import json
+import mmap
+import os
+import re
+import sys
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Any
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json is the fallback
+    orjson = None
 
-@dataclass
+
+# Parsed dbt artifacts keyed by path, stamped with (mtime_ns, size) so repeated
+# catalog builds in one process skip the JSON parse while the file is unchanged
+_ARTIFACT_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+# Compiled catalog persisted next to the dbt artifacts it was built from. The
+# stamp includes a hash of this module, so any change to the parsers or layer
+# dataclasses invalidates catalogs written by older code; bump the version
+# whenever the build output changes for any other reason
+COMPILED_CATALOG_FILENAME = "metadata_catalog.json"
+_COMPILED_CATALOG_VERSION = 2
+_CODE_FINGERPRINT = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+# Layer fields interned by the parsers; re-interned when loading a compiled catalog
+_INTERNED_FIELDS = frozenset(('schema', 'database', 'source_name', 'materialization'))
+
+
+# manifest.json fields read by the catalog parsers; everything else (compiled
+# SQL, columns, docs, macros, ...) is dropped right after parsing
+_SOURCE_FIELDS = ('name', 'schema', 'database', 'source_name', 'description', 'meta')
+_MODEL_FIELDS = (
+    'name', 'resource_type', 'schema', 'database', 'config', 'description',
+    'depends_on', 'meta',
+)
+_EXPOSURE_FIELDS = (
+    'name', 'type', 'description', 'url', 'owner', 'maturity', 'depends_on', 'meta',
+)
+
+
+def _project(node: Dict, fields: Tuple[str, ...]) -> Dict:
+    """Keep only the given keys of a manifest node"""
+    return {k: node[k] for k in fields if k in node}
+
+
+def _slim_manifest(manifest: Dict) -> Dict:
+    """Project manifest.json down to the sources, models and exposures fields we read"""
+    return {
+        'metadata': manifest.get('metadata', {}),
+        'sources': {
+            node_id: _project(node, _SOURCE_FIELDS)
+            for node_id, node in manifest.get('sources', {}).items()
+        },
+        'nodes': {
+            node_id: _project(node, _MODEL_FIELDS)
+            for node_id, node in manifest.get('nodes', {}).items()
+            if node.get('resource_type') == 'model'
+        },
+        'exposures': {
+            node_id: _project(node, _EXPOSURE_FIELDS)
+            for node_id, node in manifest.get('exposures', {}).items()
+        },
+    }
+
+
+def _shallow_dict(node: Any) -> Dict[str, Any]:
+    """
+    Field dict of a catalog dataclass.
+
+    Unlike dataclasses.asdict() this does not deep-copy list/dict fields;
+    the result is only ever serialized, never mutated.
+    """
+    return {name: getattr(node, name) for name in node.__dataclass_fields__}
+
+
+def _intern(value: Any) -> Any:
+    """Intern a repeated string field; dbt leaves some of them null"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+_REF_ARGS = re.compile(r"ref\(([^)]*)\)")
+_QUOTED = re.compile(r"""['"]([^'"]+)['"]""")
+
+
+def _ref_name(model_ref: str) -> str:
+    """Extract the model name from ref('name') or ref('package', 'name')"""
+    match = _REF_ARGS.search(model_ref)
+    if not match:
+        return model_ref
+    args = _QUOTED.findall(match.group(1))
+    return args[-1] if args else model_ref
+
+
+def _orjson_load(path: Path) -> Any:
+    """Parse a JSON file with orjson straight from a read-only memory map"""
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as buffer:
+            return orjson.loads(buffer)
+
+
+def _load_json_artifact(path: Path, transform: Optional[Callable[[Dict], Dict]] = None) -> Dict:
+    """
+    Load a dbt JSON artifact, reusing the previous parse if the file is unchanged.
+
+    If given, transform is applied to the parsed document before it is cached
+    so the full tree can be released immediately.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path.resolve())
+    cached = _ARTIFACT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if orjson is not None:
+        data = _orjson_load(path)
+    else:
+        with open(path) as f:
+            data = json.load(f)
+    if transform is not None:
+        data = transform(data)
+    _ARTIFACT_CACHE[key] = (stamp, data)
+    return data
+
+
+@dataclass(slots=True, frozen=True)
 class Table:
     """Base layer: dbt source"""
     id: str
@@ -31,7 +158,7 @@ class Table:
     meta: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class View:
     """Second layer: dbt model"""
     id: str
@@ -44,7 +171,7 @@ class View:
     meta: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Report:
     """Third layer: dbt semantic model"""
     id: str
@@ -58,7 +185,7 @@ class Report:
     meta: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Dashboard:
     """Top layer: dbt exposure"""
     id: str
@@ -79,10 +206,15 @@ class MetadataCatalog:
     between Tables -> Views -> Reports -> Dashboards
     """
     
+    _LAYERS = (
+        ('tables', Table),
+        ('views', View),
+        ('reports', Report),
+        ('dashboards', Dashboard),
+    )
+    
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
-        self.manifest = self._load_manifest()
-        self.semantic_manifest = self._load_semantic_manifest()
         
         # Storage for each layer
         self.tables: Dict[str, Table] = {}
@@ -90,8 +222,103 @@ class MetadataCatalog:
         self.reports: Dict[str, Report] = {}
         self.dashboards: Dict[str, Dashboard] = {}
         
-        # Build the catalog
-        self._build_catalog()
+        # Memoized lineage output; the layers are immutable once built
+        self._node_dicts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lineage_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Reuse the compiled catalog if the dbt artifacts haven't changed,
+        # otherwise build from the manifests and persist the result
+        stamp = self._artifact_stamp()
+        if not self._load_compiled_catalog(stamp):
+            self._build_catalog()
+            self.dbt_version = self.manifest.get('metadata', {}).get('dbt_version')
+            self._save_compiled_catalog(stamp)
+    
+    @cached_property
+    def manifest(self) -> Dict:
+        """Slim manifest.json, loaded on first access"""
+        return self._load_manifest()
+    
+    @cached_property
+    def semantic_manifest(self) -> Dict:
+        """semantic_manifest.json, loaded on first access"""
+        return self._load_semantic_manifest()
+    
+    @property
+    def _compiled_catalog_path(self) -> Path:
+        return self.project_path / "target" / COMPILED_CATALOG_FILENAME
+    
+    def _artifact_stamp(self) -> List:
+        """
+        Freshness key for the compiled catalog: [mtime_ns, size] of each dbt
+        artifact plus the fingerprint of the code that built it
+        """
+        stamp: List[Any] = [_CODE_FINGERPRINT]
+        for name in ("manifest.json", "semantic_manifest.json"):
+            try:
+                st = (self.project_path / "target" / name).stat()
+            except FileNotFoundError:
+                stamp.append(None)
+            else:
+                stamp.append([st.st_mtime_ns, st.st_size])
+        return stamp
+    
+    def _load_compiled_catalog(self, stamp: List) -> bool:
+        """Populate the layers from the compiled catalog if it matches stamp"""
+        if stamp[1] is None:
+            return False
+        path = self._compiled_catalog_path
+        try:
+            if orjson is not None:
+                compiled = _orjson_load(path)
+            else:
+                with open(path) as f:
+                    compiled = json.load(f)
+            if (compiled.get('version') != _COMPILED_CATALOG_VERSION
+                    or compiled.get('stamp') != stamp):
+                return False
+            layers = {
+                attr: {
+                    k: cls(**{
+                        name: _intern(value) if name in _INTERNED_FIELDS else value
+                        for name, value in v.items()
+                    })
+                    for k, v in compiled[attr].items()
+                }
+                for attr, cls in self._LAYERS
+            }
+        except Exception:
+            # Missing, stale or unreadable: fall back to a full build
+            return False
+        
+        for attr, items in layers.items():
+            setattr(self, attr, items)
+        self.dbt_version = compiled.get('dbt_version')
+        return True
+    
+    def _save_compiled_catalog(self, stamp: List):
+        """Persist the built layers so the next process can skip the manifest parse"""
+        compiled = {
+            'version': _COMPILED_CATALOG_VERSION,
+            'stamp': stamp,
+            'dbt_version': self.dbt_version,
+        }
+        for attr, _ in self._LAYERS:
+            compiled[attr] = {k: _shallow_dict(v) for k, v in getattr(self, attr).items()}
+        
+        path = self._compiled_catalog_path
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            if orjson is not None:
+                tmp_path.write_bytes(orjson.dumps(compiled))
+            else:
+                with open(tmp_path, 'w') as f:
+                    json.dump(compiled, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A read-only target/ only costs us the cache
+            tmp_path.unlink(missing_ok=True)
+            print(f"Warning: Could not write compiled catalog to {path}: {e}")
     
     def _load_manifest(self) -> Dict:
         """Load dbt's manifest.json"""
@@ -101,8 +328,7 @@ class MetadataCatalog:
                 f"manifest.json not found at {manifest_path}. "
                 "Run 'dbt compile' first."
             )
-        with open(manifest_path) as f:
-            return json.load(f)
+        return _load_json_artifact(manifest_path, _slim_manifest)
     
     def _load_semantic_manifest(self) -> Dict:
         """Load semantic_manifest.json for MetricFlow"""
@@ -110,8 +336,7 @@ class MetadataCatalog:
         if not semantic_path.exists():
             # Semantic manifest may not exist if no semantic models defined
             return {"semantic_models": {}}
-        with open(semantic_path) as f:
-            return json.load(f)
+        return _load_json_artifact(semantic_path)
     
     def _build_catalog(self):
         """Build the complete catalog from dbt artifacts"""
@@ -126,9 +351,9 @@ class MetadataCatalog:
             table = Table(
                 id=node_id,
                 name=node['name'],
-                schema=node['schema'],
-                database=node['database'],
-                source_name=node['source_name'],
+                schema=_intern(node['schema']),
+                database=_intern(node['database']),
+                source_name=_intern(node['source_name']),
                 description=node.get('description', ''),
                 meta=node.get('meta', {})
             )
@@ -145,9 +370,9 @@ class MetadataCatalog:
                 view = View(
                     id=node_id,
                     name=node['name'],
-                    schema=node['schema'],
-                    database=node['database'],
-                    materialization=node.get('config', {}).get('materialized', 'view'),
+                    schema=_intern(node['schema']),
+                    database=_intern(node['database']),
+                    materialization=_intern(node.get('config', {}).get('materialized', 'view')),
                     description=node.get('description', ''),
                     tables=tables,
                     meta=node.get('meta', {})
@@ -164,6 +389,11 @@ class MetadataCatalog:
             print("Warning: No semantic models found in semantic_manifest.json")
             return
         
+        # Index views by name once instead of scanning them per semantic model
+        views_by_name: Dict[str, List[str]] = {}
+        for node_id, view in self.views.items():
+            views_by_name.setdefault(view.name, []).append(node_id)
+        
         for sm_id, sm in semantic_models.items():
             # Get the model reference
             model_ref = sm.get('model', '')
@@ -171,10 +401,12 @@ class MetadataCatalog:
             # Convert ref('model_name') to node_id
             views = []
             if model_ref:
-                # Try to find matching model
-                for node_id, view in self.views.items():
-                    if view.name in model_ref or node_id in model_ref:
-                        views.append(node_id)
+                views = list(views_by_name.get(_ref_name(model_ref), ()))
+                if not views:
+                    # Fall back to a substring match for unusual references
+                    for node_id, view in self.views.items():
+                        if view.name in model_ref or node_id in model_ref:
+                            views.append(node_id)
             
             report = Report(
                 id=sm_id,
@@ -230,17 +462,32 @@ class MetadataCatalog:
         """Get table by ID"""
         return self.tables.get(table_id)
     
+    def _node_dict(self, node: Any) -> Dict[str, Any]:
+        """Field dict of a catalog node, computed once and shared across lineages"""
+        key = (type(node).__name__, node.id)
+        node_dict = self._node_dicts.get(key)
+        if node_dict is None:
+            node_dict = self._node_dicts[key] = _shallow_dict(node)
+        return node_dict
+    
     def get_dashboard_lineage(self, dashboard_id: str) -> Dict[str, Any]:
         """
         Get complete lineage for a dashboard:
         Dashboard -> Reports -> Views -> Tables
+        
+        Lineage is cached per dashboard and node dicts are shared between
+        dashboards, so treat the result as read-only.
         """
+        lineage = self._lineage_cache.get(dashboard_id)
+        if lineage is not None:
+            return lineage
+        
         dashboard = self.dashboards.get(dashboard_id)
         if not dashboard:
             raise ValueError(f"Dashboard {dashboard_id} not found")
         
         lineage = {
-            'dashboard': asdict(dashboard),
+            'dashboard': self._node_dict(dashboard),
             'reports': {},
             'views': {},
             'tables': {}
@@ -250,20 +497,21 @@ class MetadataCatalog:
         for report_id in dashboard.reports:
             report = self.reports.get(report_id)
             if report:
-                lineage['reports'][report_id] = asdict(report)
+                lineage['reports'][report_id] = self._node_dict(report)
                 
                 # For each view in the report
                 for view_id in report.views:
                     view = self.views.get(view_id)
                     if view:
-                        lineage['views'][view_id] = asdict(view)
+                        lineage['views'][view_id] = self._node_dict(view)
                         
                         # For each table in the view
                         for table_id in view.tables:
                             table = self.tables.get(table_id)
                             if table:
-                                lineage['tables'][table_id] = asdict(table)
+                                lineage['tables'][table_id] = self._node_dict(table)
         
+        self._lineage_cache[dashboard_id] = lineage
         return lineage
     
     def get_reports_for_dashboard(self, dashboard_id: str) -> List[Report]:
@@ -296,19 +544,22 @@ class MetadataCatalog:
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
                 'project_path': str(self.project_path),
-                'dbt_version': self.manifest.get('metadata', {}).get('dbt_version')
+                'dbt_version': self.dbt_version
             },
-            'tables': {k: asdict(v) for k, v in self.tables.items()},
-            'views': {k: asdict(v) for k, v in self.views.items()},
-            'reports': {k: asdict(v) for k, v in self.reports.items()},
-            'dashboards': {k: asdict(v) for k, v in self.dashboards.items()}
+            'tables': {k: _shallow_dict(v) for k, v in self.tables.items()},
+            'views': {k: _shallow_dict(v) for k, v in self.views.items()},
+            'reports': {k: _shallow_dict(v) for k, v in self.reports.items()},
+            'dashboards': {k: _shallow_dict(v) for k, v in self.dashboards.items()}
         }
         
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output, 'w') as f:
-            json.dump(catalog, f, indent=2)
+        if orjson is not None:
+            output.write_bytes(orjson.dumps(catalog, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output, 'w') as f:
+                json.dump(catalog, f, indent=2)
         
         print(f"✓ Catalog exported to {output}")
     
@@ -17,15 +17,30 @@ Usage:
     python data_delivery_server.py
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, List, Any, Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, Callable, Dict, Hashable, List, Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+import asyncio
 import json
+import os
+import time
 import duckdb
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # Arrow responses are only offered when pyarrow is installed
+    pa = None
+
 # Import the metadata catalog
 import sys
 sys.path.append(str(Path(__file__).parent))
@@ -47,16 +62,110 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Media type for Arrow IPC stream responses
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Upper bound on rows returned by a report query, whatever the client asks for
+MAX_ROWS = int(os.environ.get("REPORT_MAX_ROWS", "10000"))
+
+# Report views with at most this many rows are copied into an in-memory
+# database at startup so queries against them skip disk IO; 0 disables it
+PIN_VIEW_MAX_ROWS = int(os.environ.get("REPORT_PIN_VIEW_MAX_ROWS", "100000"))
+PINNED_DATABASE = "pinned"
+
+# Cache sizes for built report SQL and fetched results. The database is
+# opened read-only, so results only go stale when the data is reloaded;
+# the TTL bounds how long a reload can go unnoticed for on-disk views.
+# Pinned views are a startup snapshot and only change on restart.
+REPORT_QUERY_CACHE_SIZE = 1024
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 60.0
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with optional per-entry expiry"""
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 # Global catalog and database connection
 catalog: Optional[MetadataCatalog] = None
 db_conn: Optional[duckdb.DuckDBPyConnection] = None
 
+# (report_id, canonical request) -> (SQL, params), and
+# (SQL, params, format) -> result
+report_query_cache = LRUCache(REPORT_QUERY_CACHE_SIZE)
+result_cache = LRUCache(RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS)
+
+# Serialized JSON for endpoints that only read the catalog, keyed by endpoint
+catalog_responses: Dict[Hashable, bytes] = {}
+
+# "schema.view" -> in-memory copy of it, filled by pin_report_views()
+pinned_views: Dict[str, str] = {}
+
+
+def json_bytes(payload: Any) -> bytes:
+    """Serialize a payload the way FastAPI's JSONResponse would"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def catalog_response(key: Hashable, build: Callable[[], Any]) -> Response:
+    """
+    Serve a catalog-only payload, serializing it once per catalog load.
+    
+    The catalog doesn't change while the server runs, so these bodies are
+    built on first request and reused until clear_caches().
+    """
+    body = catalog_responses.get(key)
+    if body is None:
+        body = catalog_responses[key] = json_bytes(build())
+    return Response(content=body, media_type="application/json")
+
+
+def clear_caches():
+    """Drop cached SQL and results, e.g. after the catalog or database changes"""
+    catalog_responses.clear()
+    report_templates.clear()
+    report_query_cache.clear()
+    result_cache.clear()
+
 
 class ReportFilter(BaseModel):
     """Filter criteria for a report query"""
     dimensions: Dict[str, List[str]] = {}
     date_range: Optional[Dict[str, str]] = None
-    limit: Optional[int] = None
+    limit: Optional[int] = Field(default=None, ge=1)
 
 
 class ReportDataRequest(BaseModel):
@@ -70,6 +179,7 @@ class ReportDataRequest(BaseModel):
 async def startup_event():
     """Initialize the metadata catalog and database connection"""
     global catalog, db_conn
+    clear_caches()
     
     # Load the metadata catalog
     project_path = Path(__file__).parent.parent
@@ -87,6 +197,15 @@ async def startup_event():
         print(f"✓ Connected to DuckDB at {db_path}")
     except Exception as e:
         print(f"⚠ Warning: Could not connect to DuckDB: {e}")
+    
+    if catalog:
+        # Serialize the catalog listings before the first request
+        catalog_response("dashboards", dashboards_payload)
+        catalog_response("reports", reports_payload)
+    
+    if catalog and db_conn:
+        pin_report_views()
+        print(f"✓ Pinned {len(pinned_views)} report views in memory")
 
 
 @app.on_event("shutdown")
@@ -122,12 +241,8 @@ async def health_check():
     }
 
 
-@app.get("/api/dashboards")
-async def list_dashboards():
-    """List all available dashboards"""
-    if not catalog:
-        raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
-    
+def dashboards_payload() -> Dict[str, Any]:
+    """Summaries of every dashboard in the catalog"""
     dashboards = []
     for dashboard_id, dashboard in catalog.dashboards.items():
         dashboards.append({
@@ -143,16 +258,8 @@ async def list_dashboards():
     return {"dashboards": dashboards, "count": len(dashboards)}
 
 
-@app.get("/api/dashboards/{dashboard_id}")
-async def get_dashboard(dashboard_id: str):
-    """Get dashboard metadata including all reports"""
-    if not catalog:
-        raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
-    
-    dashboard = catalog.get_dashboard(dashboard_id)
-    if not dashboard:
-        raise HTTPException(status_code=404, detail=f"Dashboard {dashboard_id} not found")
-    
+def dashboard_payload(dashboard: Any) -> Dict[str, Any]:
+    """Dashboard metadata including all reports"""
     # Get report details
     reports = []
     for report_id in dashboard.reports:
@@ -167,7 +274,7 @@ async def get_dashboard(dashboard_id: str):
             })
     
     return {
-        "id": dashboard_id,
+        "id": dashboard.id,
         "name": dashboard.name,
         "type": dashboard.type,
         "description": dashboard.description,
@@ -179,6 +286,28 @@ async def get_dashboard(dashboard_id: str):
     }
 
 
+@app.get("/api/dashboards")
+async def list_dashboards():
+    """List all available dashboards"""
+    if not catalog:
+        raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
+    
+    return catalog_response("dashboards", dashboards_payload)
+
+
+@app.get("/api/dashboards/{dashboard_id}")
+async def get_dashboard(dashboard_id: str):
+    """Get dashboard metadata including all reports"""
+    if not catalog:
+        raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
+    
+    dashboard = catalog.get_dashboard(dashboard_id)
+    if not dashboard:
+        raise HTTPException(status_code=404, detail=f"Dashboard {dashboard_id} not found")
+    
+    return catalog_response(("dashboard", dashboard_id), lambda: dashboard_payload(dashboard))
+
+
 @app.get("/api/dashboards/{dashboard_id}/lineage")
 async def get_dashboard_lineage(dashboard_id: str):
     """Get complete lineage for a dashboard"""
@@ -193,13 +322,25 @@ async def get_dashboard_lineage(dashboard_id: str):
 
 
 @app.post("/api/reports/{report_id}/data")
-async def get_report_data(report_id: str, request: ReportDataRequest):
+async def get_report_data(
+    report_id: str,
+    request: ReportDataRequest,
+    accept: Annotated[Optional[str], Header()] = None
+):
     """
     Execute a report query and return data.
     
     In a real implementation, this would use MetricFlow to generate SQL.
     For this demo, we'll directly query the underlying view.
+    
+    Clients sending `Accept: application/vnd.apache.arrow.stream` receive the
+    result as an Arrow IPC stream instead of JSON records. This needs pyarrow
+    (the `arrow` extra); without it such requests get 406 Not Acceptable.
     """
+    as_arrow = accept is not None and ARROW_STREAM_MEDIA_TYPE in accept
+    if as_arrow and pa is None:
+        raise HTTPException(status_code=406, detail="Arrow responses require pyarrow")
+    
     if not catalog:
         raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
     if not db_conn:
@@ -212,33 +353,152 @@ async def get_report_data(report_id: str, request: ReportDataRequest):
     try:
         # Build a simple SQL query based on the report's semantic model
         # In production, you would use MetricFlow here
-        sql = build_report_query(report, request)
+        # Identical requests reuse the built SQL and, within the TTL, the result
+        query_key = (report_id, json.dumps(request.model_dump(), sort_keys=True))
+        query = report_query_cache.get(query_key)
+        if query is None:
+            query = build_report_query(report, request)
+            report_query_cache.set(query_key, query)
+        sql, params = query
         
-        # Execute query
-        result = db_conn.execute(sql).fetchdf()
+        # Execute query off the event loop so other requests keep being served
+        result_key = (sql, tuple(params), as_arrow)
+        cached = result_cache.get(result_key)
+        if cached is None:
+            fetch = run_query_arrow if as_arrow else run_query
+            result = await asyncio.to_thread(fetch, sql, params)
+            
+            # Drop the sentinel row past the ceiling
+            truncated = len(result) > MAX_ROWS
+            if truncated:
+                result = result.slice(0, MAX_ROWS) if as_arrow else result[:MAX_ROWS]
+            cached = (result, truncated)
+            result_cache.set(result_key, cached)
+        result, truncated = cached
         
-        # Convert to JSON-serializable format
-        data = result.to_dict(orient='records')
+        if as_arrow:
+            return Response(
+                content=arrow_ipc_bytes(result),
+                media_type=ARROW_STREAM_MEDIA_TYPE,
+                headers={
+                    "X-Report-Id": report_id,
+                    "X-Row-Count": str(result.num_rows),
+                    "X-Truncated": str(truncated).lower()
+                }
+            )
         
         return {
             "report_id": report_id,
             "report_name": report.name,
-            "data": data,
-            "row_count": len(data),
+            "data": result,
+            "row_count": len(result),
+            "truncated": truncated,
             "sql": sql,  # Include for debugging
+            "params": params,
             "generated_at": datetime.now().isoformat()
         }
     
+    except InvalidReportRequest as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Query execution failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Query execution failed: {str(e)}") from e
 
 
-def build_report_query(report: Any, request: ReportDataRequest) -> str:
+def run_query(sql: str, params: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
     """
-    Build SQL query for a report.
+    Execute a query on its own cursor and return the rows as records.
     
-    This is a simplified version. In production, you would use MetricFlow
-    to generate the SQL based on the semantic model definition.
+    Called from worker threads: a DuckDB connection must not be shared by
+    concurrent executes, so each query gets a cursor (a child connection to
+    the same database). Rows are built straight from the fetched tuples
+    rather than going through a pandas DataFrame.
+    """
+    cursor = db_conn.cursor()
+    try:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def run_query_arrow(sql: str, params: Optional[List[Any]] = None) -> "pa.Table":
+    """Execute a query on its own cursor and return the result as an Arrow table"""
+    cursor = db_conn.cursor()
+    try:
+        return cursor.execute(sql, params).fetch_arrow_table()
+    finally:
+        cursor.close()
+
+
+def arrow_ipc_bytes(table: "pa.Table") -> bytes:
+    """Serialize an Arrow table as an IPC stream"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class InvalidReportRequest(ValueError):
+    """A report request referenced a field the report's semantic model doesn't define"""
+
+
+# SQL templates for the semantic model aggregations we can translate
+AGGREGATIONS = {
+    'sum': 'SUM({})',
+    'min': 'MIN({})',
+    'max': 'MAX({})',
+    'average': 'AVG({})',
+    'avg': 'AVG({})',
+    'median': 'MEDIAN({})',
+    'count': 'COUNT({})',
+    'count_distinct': 'COUNT(DISTINCT {})',
+    'sum_boolean': 'SUM(CAST({} AS INTEGER))',
+}
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a SQL identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@dataclass
+class ReportQueryTemplate:
+    """The parts of a report's SQL that don't depend on the request"""
+    report_id: str
+    view_name: str
+    dimension_selects: Dict[str, Tuple[str, str]]  # name -> (SELECT item, GROUP BY expr)
+    measure_selects: Dict[str, str]  # name -> SELECT item
+    unsupported_aggregations: Dict[str, str]  # measure name -> agg
+    default_dimensions: List[str]
+    default_metric: Optional[str]
+    
+    def dimension(self, name: str) -> Tuple[str, str]:
+        """Resolve a dimension to its SELECT item and expression"""
+        if name not in self.dimension_selects:
+            raise InvalidReportRequest(f"Unknown dimension '{name}' for report {self.report_id}")
+        return self.dimension_selects[name]
+    
+    def measure(self, name: str) -> str:
+        """Resolve a metric to its aggregated SELECT item"""
+        if name in self.unsupported_aggregations:
+            agg = self.unsupported_aggregations[name]
+            raise InvalidReportRequest(f"Unsupported aggregation '{agg}' for metric '{name}'")
+        if name not in self.measure_selects:
+            raise InvalidReportRequest(f"Unknown metric '{name}' for report {self.report_id}")
+        return self.measure_selects[name]
+
+
+# report_id -> ReportQueryTemplate; reports only change with the catalog
+report_templates: Dict[str, ReportQueryTemplate] = {}
+
+
+def build_report_template(report: Any) -> ReportQueryTemplate:
+    """
+    Resolve a report's view, dimensions and measures into SQL fragments.
+    
+    Raises:
+        ValueError: If the report's view can't be found in the catalog
     """
     # Get the view/model that the report is based on
     view_name = None
@@ -249,72 +509,173 @@ def build_report_query(report: Any, request: ReportDataRequest) -> str:
     
     if not view_name:
         raise ValueError(f"Could not determine view for report {report.id}")
+    view_name = pinned_views.get(view_name, view_name)
+    
+    dimension_selects = {}
+    for dim in report.dimensions:
+        name = dim['name']
+        expr = dim.get('expr', name)
+        item = expr if expr == name else f"{expr} AS {quote_identifier(name)}"
+        dimension_selects[name] = (item, expr)
+    
+    measure_selects = {}
+    unsupported_aggregations = {}
+    for measure in report.measures:
+        name = measure['name']
+        agg = measure.get('agg', 'sum').lower()
+        if agg not in AGGREGATIONS:
+            unsupported_aggregations[name] = agg
+            continue
+        expr = measure.get('expr', name)
+        measure_selects[name] = f"{AGGREGATIONS[agg].format(expr)} AS {quote_identifier(name)}"
+    
+    return ReportQueryTemplate(
+        report_id=report.id,
+        view_name=view_name,
+        dimension_selects=dimension_selects,
+        measure_selects=measure_selects,
+        unsupported_aggregations=unsupported_aggregations,
+        default_dimensions=list(dimension_selects)[:3],  # Take first 3 dimensions
+        default_metric=report.measures[0]['name'] if report.measures else None
+    )
+
+
+def pin_report_views(max_rows: Optional[int] = None) -> Dict[str, str]:
+    """
+    Copy small report views into an in-memory database attached to db_conn.
+    
+    The database file is opened read-only, so a writable in-memory database
+    is attached alongside it; unlike TEMP tables, its tables are visible to
+    the per-query cursors. Views with more than max_rows rows stay on disk.
+    
+    Args:
+        max_rows: Largest view to pin (defaults to PIN_VIEW_MAX_ROWS)
+    
+    Returns:
+        Mapping of pinned "schema.view" names to their in-memory tables
+    """
+    if max_rows is None:
+        max_rows = PIN_VIEW_MAX_ROWS
+    # Templates, built SQL and results may all name the unpinned views
+    pinned_views.clear()
+    report_templates.clear()
+    report_query_cache.clear()
+    result_cache.clear()
+    if max_rows <= 0:
+        return pinned_views
+    
+    try:
+        db_conn.execute(f"ATTACH IF NOT EXISTS ':memory:' AS {PINNED_DATABASE} (READ_WRITE)")
+    except duckdb.Error as e:
+        # Queries fall back to the on-disk views
+        print(f"⚠ Warning: Could not attach in-memory database: {e}")
+        return pinned_views
+    view_ids = sorted({report.views[0] for report in catalog.reports.values() if report.views})
+    for view_id in view_ids:
+        view = catalog.get_view(view_id)
+        if not view:
+            continue
+        source = f"{view.schema}.{view.name}"
+        target = f"{PINNED_DATABASE}.{quote_identifier(f'{view.schema}__{view.name}')}"
+        try:
+            (row_count,) = db_conn.execute(
+                f"SELECT count(*) FROM (SELECT 1 FROM {source} LIMIT ?)", [max_rows + 1]
+            ).fetchone()
+            if row_count > max_rows:
+                continue
+            db_conn.execute(f"CREATE OR REPLACE TABLE {target} AS SELECT * FROM {source}")
+        except duckdb.Error as e:
+            print(f"⚠ Warning: Could not pin view {source}: {e}")
+            continue
+        pinned_views[source] = target
+    
+    return pinned_views
+
+
+def get_report_template(report: Any) -> ReportQueryTemplate:
+    """Return the report's query template, building it on first use"""
+    template = report_templates.get(report.id)
+    if template is None:
+        template = report_templates[report.id] = build_report_template(report)
+    return template
+
+
+def build_report_query(report: Any, request: ReportDataRequest) -> Tuple[str, List[Any]]:
+    """
+    Build SQL query for a report.
+    
+    This is a simplified version. In production, you would use MetricFlow
+    to generate the SQL based on the semantic model definition.
+    
+    Dimensions, metrics and aggregations are resolved against the report's
+    semantic model so only expressions from the dbt project end up in the
+    SQL text; every client-supplied value is bound as a `?` parameter.
+    
+    Returns:
+        Tuple of (sql, params)
+    
+    Raises:
+        InvalidReportRequest: If the request names an unknown dimension,
+            metric or aggregation
+    """
+    template = get_report_template(report)
     
     # Build SELECT clause
     select_fields = []
-    if request.group_by:
-        select_fields.extend(request.group_by)
-    else:
-        # Default group by dimensions from the report
-        for dim in report.dimensions[:3]:  # Take first 3 dimensions
-            select_fields.append(dim['expr'] if 'expr' in dim else dim['name'])
+    group_by_fields = []
+    for name in request.group_by or template.default_dimensions:
+        item, expr = template.dimension(name)
+        select_fields.append(item)
+        group_by_fields.append(expr)
     
     # Add measures (aggregations)
     if request.metrics:
-        for metric in request.metrics:
-            # Find the measure definition
-            for measure in report.measures:
-                if measure['name'] == metric:
-                    agg = measure.get('agg', 'sum')
-                    expr = measure.get('expr', metric)
-                    select_fields.append(f"{agg.upper()}({expr}) as {metric}")
-    else:
+        select_fields.extend(template.measure(metric) for metric in request.metrics)
+    elif template.default_metric:
         # Default to first measure
-        if report.measures:
-            measure = report.measures[0]
-            agg = measure.get('agg', 'sum')
-            expr = measure.get('expr', measure['name'])
-            select_fields.append(f"{agg.upper()}({expr}) as {measure['name']}")
+        select_fields.append(template.measure(template.default_metric))
     
     # Build WHERE clause
     where_clauses = []
+    params: List[Any] = []
     if request.filters:
         if request.filters.dimensions:
             for dim, values in request.filters.dimensions.items():
                 if values:
-                    value_list = "','".join(values)
-                    where_clauses.append(f"{dim} IN ('{value_list}')")
+                    placeholders = ', '.join('?' * len(values))
+                    where_clauses.append(f"{template.dimension(dim)[1]} IN ({placeholders})")
+                    params.extend(values)
         
         if request.filters.date_range:
             if 'start' in request.filters.date_range:
-                where_clauses.append(f"year_month >= '{request.filters.date_range['start']}'")
+                where_clauses.append("year_month >= ?")
+                params.append(request.filters.date_range['start'])
             if 'end' in request.filters.date_range:
-                where_clauses.append(f"year_month <= '{request.filters.date_range['end']}'")
-    
-    # Build GROUP BY clause
-    group_by_fields = request.group_by if request.group_by else [select_fields[0]]
+                where_clauses.append("year_month <= ?")
+                params.append(request.filters.date_range['end'])
     
     # Assemble query
-    sql = f"SELECT {', '.join(select_fields)} FROM {view_name}"
+    sql = f"SELECT {', '.join(select_fields)} FROM {template.view_name}"
     
     if where_clauses:
         sql += f" WHERE {' AND '.join(where_clauses)}"
     
-    sql += f" GROUP BY {', '.join(group_by_fields)}"
+    if group_by_fields:
+        sql += f" GROUP BY {', '.join(group_by_fields)}"
     
-    # Add LIMIT if specified
-    if request.filters and request.filters.limit:
-        sql += f" LIMIT {request.filters.limit}"
+    # Always bound the result. Without a client limit under the ceiling we
+    # ask for one row past MAX_ROWS so the caller can tell it was truncated
+    limit = request.filters.limit if request.filters else None
+    if limit is None or limit > MAX_ROWS:
+        limit = MAX_ROWS + 1
+    sql += " LIMIT ?"
+    params.append(limit)
     
-    return sql
+    return sql, params
 
 
-@app.get("/api/reports")
-async def list_reports():
-    """List all available reports"""
-    if not catalog:
-        raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
-    
+def reports_payload() -> Dict[str, Any]:
+    """Summaries of every report in the catalog"""
     reports = []
     for report_id, report in catalog.reports.items():
         reports.append({
@@ -329,6 +690,15 @@ async def list_reports():
     return {"reports": reports, "count": len(reports)}
 
 
+@app.get("/api/reports")
+async def list_reports():
+    """List all available reports"""
+    if not catalog:
+        raise HTTPException(status_code=503, detail="Metadata catalog not loaded")
+    
+    return catalog_response("reports", reports_payload)
+
+
 # Example micro-frontend compatible endpoint
 @app.post("/api/dashboards/{dashboard_id}/data")
 async def get_all_dashboard_data(
@@ -347,18 +717,24 @@ async def get_all_dashboard_data(
     if not dashboard:
         raise HTTPException(status_code=404, detail=f"Dashboard {dashboard_id} not found")
     
-    # Fetch data for each report
+    # Fetch data for all reports concurrently
+    results = await asyncio.gather(
+        *(
+            get_report_data(report_id, ReportDataRequest(filters=filters))
+            for report_id in dashboard.reports
+        ),
+        return_exceptions=True
+    )
+    
     report_data = {}
-    for report_id in dashboard.reports:
-        try:
-            request = ReportDataRequest(filters=filters)
-            result = await get_report_data(report_id, request)
-            report_data[report_id] = result
-        except Exception as e:
+    for report_id, result in zip(dashboard.reports, results, strict=True):
+        if isinstance(result, Exception):
             report_data[report_id] = {
-                "error": str(e),
+                "error": str(result),
                 "report_id": report_id
             }
+        else:
+            report_data[report_id] = result
     
     return {
         "dashboard_id": dashboard_id,
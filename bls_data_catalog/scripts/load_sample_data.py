@@ -8,8 +8,9 @@ datasets/employment-us and saves it as a cleaned CSV file in the dbt seeds direc
 Source: https://github.com/datasets/employment-us
 """
 
+import json
 import sys
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 from typing import Callable, Final
 
@@ -30,50 +31,153 @@ DATA_URL: Final[str] = "https://github.com/datasets/employment-us/raw/refs/heads
 OUTPUT_FILENAME: Final[str] = "us_employment.csv"
 REQUEST_TIMEOUT: Final[int] = 30
 
+# Sidecar file next to the output that records the HTTP cache validators
+# (ETag / Last-Modified) of the last successful download
+HTTP_CACHE_SUFFIX: Final[str] = ".meta.json"
+
+# Shared HTTP session so repeated downloads in one process reuse pooled
+# keep-alive connections instead of opening a new TLS connection each time
+SESSION: Final[requests.Session] = requests.Session()
+
 # Columns to exclude from the final dataset
 EXCLUDED_COLUMNS: Final[list[str]] = ['footnotes']
 
+# Column types of the employment-us CSV, given up front so pandas doesn't
+# have to infer them; columns not listed here are still inferred
+EMPLOYMENT_DTYPES: Final[dict[str, str]] = {
+    'year': 'int64',
+    'population': 'int64',
+    'labor_force': 'int64',
+    'population_percent': 'float64',
+    'employed_total': 'int64',
+    'employed_percent': 'float64',
+    'agrictulture_ratio': 'int64',
+    'nonagriculture_ratio': 'int64',
+    'unemployed': 'int64',
+    'unemployed_percent': 'float64',
+    'not_in_labor': 'int64',
+}
+
+
+def _http_cache_path(output_path: Path) -> Path:
+    """Return the path of the HTTP cache validators sidecar for an output file."""
+    return output_path.with_suffix(HTTP_CACHE_SUFFIX)
+
+
+def _load_http_validators(output_path: Path, url: str) -> dict[str, str]:
+    """
+    Load the HTTP cache validators recorded for an output file.
+
+    Validators are only reused for the URL they were recorded against, so
+    switching sources never revalidates against the old file.
 
-def _fetch_csv_data(url: str) -> str:
+    Args:
+        output_path: Path of the previously saved CSV
+        url: URL about to be fetched
+
+    Returns:
+        Recorded validators, or an empty dict if the output or sidecar is
+        missing or was recorded for a different URL
     """
-    Fetch CSV data from a URL.
+    cache_path = _http_cache_path(output_path)
+    if not output_path.exists() or not cache_path.exists():
+        return {}
+    try:
+        recorded = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(recorded, dict) or recorded.pop('url', None) != url:
+        return {}
+    return recorded
+
+
+def _save_http_validators(output_path: Path, url: str, validators: dict[str, str]) -> None:
+    """
+    Record the HTTP cache validators for a freshly saved output file.
+
+    An empty dict removes any stale sidecar so the next run does a full download.
+
+    Args:
+        output_path: Path of the saved CSV
+        url: URL the CSV was downloaded from
+        validators: ETag / Last-Modified values from the response
+    """
+    cache_path = _http_cache_path(output_path)
+    if validators:
+        cache_path.write_text(json.dumps({'url': url, **validators}))
+    else:
+        cache_path.unlink(missing_ok=True)
+
+
+def _fetch_csv_data_if_modified(
+    url: str,
+    output_path: Path,
+) -> tuple[bytes | None, dict[str, str]]:
+    """
+    Fetch CSV data with a conditional GET against the last download.
+
+    The body is returned undecoded so pandas can parse the bytes directly
+    instead of going through a str copy of the file.
 
     Args:
         url: URL to the raw CSV file
+        output_path: Path of the previously saved CSV
 
     Returns:
-        Raw CSV content as string
+        Tuple of (raw CSV bytes, validators); the bytes are None when the
+        server answers 304 Not Modified
 
     Raises:
         requests.exceptions.RequestException: If download fails
     """
-    response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    validators = _load_http_validators(output_path, url)
+    headers = {}
+    if 'etag' in validators:
+        headers['If-None-Match'] = validators['etag']
+    if 'last_modified' in validators:
+        headers['If-Modified-Since'] = validators['last_modified']
+
+    response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        return None, validators
     response.raise_for_status()
-    return response.text
+
+    validators = {
+        key: value
+        for key, value in (
+            ('etag', response.headers.get('ETag')),
+            ('last_modified', response.headers.get('Last-Modified')),
+        )
+        if value
+    }
+    return response.content, validators
 
 
-def _clean_employment_data(raw_csv: str) -> pd.DataFrame:
+def _clean_employment_data(raw_csv: str | bytes) -> pd.DataFrame:
     """
     Clean and process employment data CSV.
 
     Removes the 'footnotes' column which has inconsistent data
-    (some rows have values, some are empty).
+    (some rows have values, some are empty). Excluded columns are never
+    parsed rather than being dropped after the fact.
 
     Args:
-        raw_csv: Raw CSV content as string
+        raw_csv: Raw CSV content as bytes or string
 
     Returns:
         Cleaned pandas DataFrame
-    """
-    # Read CSV into DataFrame
-    df = pd.read_csv(StringIO(raw_csv))
 
-    # Drop excluded columns
-    columns_to_drop = [col for col in EXCLUDED_COLUMNS if col in df.columns]
-    if columns_to_drop:
-        df = df.drop(columns=columns_to_drop)
+    Raises:
+        ValueError: If a column doesn't match its type in EMPLOYMENT_DTYPES
+    """
+    buffer = BytesIO(raw_csv) if isinstance(raw_csv, bytes) else StringIO(raw_csv)
 
-    return df
+    # Read CSV into DataFrame, skipping excluded columns at parse time
+    return pd.read_csv(
+        buffer,
+        usecols=lambda col: col not in EXCLUDED_COLUMNS,
+        dtype=EMPLOYMENT_DTYPES,
+    )
 
 
 def _save_dataframe(df: pd.DataFrame, output_path: Path) -> None:
@@ -94,7 +198,9 @@ def _save_dataframe(df: pd.DataFrame, output_path: Path) -> None:
 def download_and_process_bls_employment_data(
     url: str,
     output_path: Path,
-    fetch_func: Callable[[str], str] | None = None,
+    fetch_func: Callable[[str], str | bytes] | None = None,
+    *,
+    write_output: bool = True,
 ) -> pd.DataFrame:
     """
     Download BLS employment data, clean it, and save to file.
@@ -102,7 +208,11 @@ def download_and_process_bls_employment_data(
     Args:
         url: URL to the raw CSV file
         output_path: Path where the CSV should be saved
-        fetch_func: Optional function to fetch CSV data from URL (default: _fetch_csv_data)
+        fetch_func: Optional function to fetch CSV data from URL. By default the
+            data is fetched with a conditional GET, and an unchanged upstream file
+            (HTTP 304) returns the previously saved data without rewriting it.
+        write_output: Whether to save the cleaned data to output_path. When False
+            the DataFrame is only returned.
 
     Returns:
         Cleaned pandas DataFrame
@@ -111,20 +221,26 @@ def download_and_process_bls_employment_data(
         requests.exceptions.RequestException: If download fails
         Exception: If data processing fails
     """
-    if fetch_func is None:
-        fetch_func = _fetch_csv_data
-
     print(f"Downloading data from: {url}")
 
     # Fetch raw CSV data
-    raw_csv = fetch_func(url)
+    if fetch_func is None:
+        # Default fetcher revalidates against the previous download
+        raw_csv, validators = _fetch_csv_data_if_modified(url, output_path)
+        if raw_csv is None:
+            print("Data unchanged since last download, reusing existing file")
+            return _clean_employment_data(output_path.read_bytes())
+    else:
+        raw_csv, validators = fetch_func(url), {}
 
     # Clean the data
     print("Cleaning data...")
     df = _clean_employment_data(raw_csv)
 
     # Save to file
-    _save_dataframe(df, output_path)
+    if write_output:
+        _save_dataframe(df, output_path)
+        _save_http_validators(output_path, url, validators)
 
     return df
 
@@ -0,0 +1,311 @@
+"""Unit tests for build_metadata_catalog.py script."""
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from bls_data_catalog.scripts import build_metadata_catalog
+from bls_data_catalog.scripts.build_metadata_catalog import MetadataCatalog
+
+# Test data fixtures
+SOURCE_ID = "source.bls_data_catalog.bls.us_employment"
+VIEW_ID = "model.bls_data_catalog.stg_us_employment"
+REPORT_ID = "semantic_model.bls_data_catalog.us_employment"
+DASHBOARD_ID = "exposure.bls_data_catalog.labor_market_dashboard"
+
+SAMPLE_MANIFEST: dict[str, Any] = {
+    "metadata": {"dbt_version": "1.10.15"},
+    "sources": {
+        SOURCE_ID: {
+            "name": "us_employment",
+            "schema": "raw",
+            "database": "bls_data",
+            "source_name": "bls",
+            "description": "Annual US employment statistics",
+            "meta": {},
+        },
+    },
+    "nodes": {
+        VIEW_ID: {
+            "name": "stg_us_employment",
+            "resource_type": "model",
+            "schema": "analytics",
+            "database": "bls_data",
+            "config": {"materialized": "view"},
+            "description": "Cleaned employment data",
+            "depends_on": {"nodes": [SOURCE_ID]},
+            "meta": {},
+            "compiled_code": "select * from raw.us_employment",
+        },
+        "test.bls_data_catalog.not_null_year": {
+            "name": "not_null_year",
+            "resource_type": "test",
+        },
+    },
+    "exposures": {
+        DASHBOARD_ID: {
+            "name": "labor_market_dashboard",
+            "type": "dashboard",
+            "description": "Labor market overview",
+            "url": "https://example.com/dashboards/labor",
+            "owner": {"name": "Analytics", "email": "analytics@example.com"},
+            "maturity": "high",
+            "depends_on": {"nodes": [VIEW_ID]},
+            "meta": {"reports": [REPORT_ID]},
+        },
+    },
+}
+
+SAMPLE_SEMANTIC_MANIFEST: dict[str, Any] = {
+    "semantic_models": {
+        REPORT_ID: {
+            "name": "us_employment",
+            "description": "Employment report",
+            "model": "ref('stg_us_employment')",
+            "entities": [{"name": "year", "type": "primary"}],
+            "dimensions": [{"name": "year", "type": "categorical"}],
+            "measures": [{"name": "employed_total", "agg": "sum"}],
+            "meta": {"visualization_type": "line"},
+        },
+    },
+}
+
+
+@pytest.fixture
+def project_path(tmp_path: Path) -> Path:
+    """
+    Create a dbt project directory with compiled artifacts.
+
+    Args:
+        tmp_path: pytest's temporary directory fixture
+
+    Returns:
+        Path to the project directory
+    """
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "manifest.json").write_text(json.dumps(SAMPLE_MANIFEST))
+    (target / "semantic_manifest.json").write_text(json.dumps(SAMPLE_SEMANTIC_MANIFEST))
+    return tmp_path
+
+
+class TestMetadataCatalog:
+    """Tests for MetadataCatalog construction and queries."""
+
+    def test_builds_all_layers(self, project_path: Path) -> None:
+        """Test that each layer is populated from the dbt artifacts."""
+        catalog = MetadataCatalog(project_path)
+
+        assert list(catalog.tables) == [SOURCE_ID]
+        assert list(catalog.views) == [VIEW_ID]
+        assert list(catalog.reports) == [REPORT_ID]
+        assert list(catalog.dashboards) == [DASHBOARD_ID]
+
+    def test_links_report_to_view(self, project_path: Path) -> None:
+        """Test that a semantic model's ref() resolves to its view."""
+        catalog = MetadataCatalog(project_path)
+
+        assert catalog.get_report(REPORT_ID).views == [VIEW_ID]
+
+    def test_dashboard_lineage(self, project_path: Path) -> None:
+        """Test that lineage walks dashboard -> reports -> views -> tables."""
+        catalog = MetadataCatalog(project_path)
+
+        lineage = catalog.get_dashboard_lineage(DASHBOARD_ID)
+
+        assert lineage["dashboard"]["name"] == "labor_market_dashboard"
+        assert list(lineage["reports"]) == [REPORT_ID]
+        assert list(lineage["views"]) == [VIEW_ID]
+        assert list(lineage["tables"]) == [SOURCE_ID]
+
+    def test_export_catalog(self, project_path: Path, tmp_path: Path) -> None:
+        """Test that the exported JSON contains every layer and the dbt version."""
+        catalog = MetadataCatalog(project_path)
+        output = tmp_path / "export" / "metadata_catalog.json"
+
+        catalog.export_catalog(str(output))
+
+        exported = json.loads(output.read_text())
+        assert exported["metadata"]["dbt_version"] == "1.10.15"
+        assert exported["tables"][SOURCE_ID]["source_name"] == "bls"
+        assert exported["views"][VIEW_ID]["tables"] == [SOURCE_ID]
+        assert exported["reports"][REPORT_ID]["views"] == [VIEW_ID]
+        assert exported["dashboards"][DASHBOARD_ID]["reports"] == [REPORT_ID]
+
+    def test_nodes_are_immutable(self, project_path: Path) -> None:
+        """Test that catalog nodes are frozen and carry no per-instance dict."""
+        catalog = MetadataCatalog(project_path)
+        view = catalog.get_view(VIEW_ID)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            view.name = "renamed"
+        assert not hasattr(view, "__dict__")
+        assert view.database is catalog.get_table(SOURCE_ID).database
+
+    def test_allows_null_database(self, project_path: Path) -> None:
+        """Test that a null database, which dbt allows, is kept as None."""
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        manifest["sources"][SOURCE_ID]["database"] = None
+        manifest["nodes"][VIEW_ID]["database"] = None
+        (project_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+
+        catalog = MetadataCatalog(project_path)
+
+        assert catalog.get_table(SOURCE_ID).database is None
+        assert catalog.get_view(VIEW_ID).database is None
+
+    def test_missing_manifest_raises(self, tmp_path: Path) -> None:
+        """Test that a missing manifest.json raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            MetadataCatalog(tmp_path)
+
+
+class TestArtifactCache:
+    """Tests for the in-process dbt artifact parse cache."""
+
+    def test_reuses_parse_when_unchanged(self, project_path: Path) -> None:
+        """Test that a second build reuses the parsed manifest."""
+        first = MetadataCatalog(project_path)
+        second = MetadataCatalog(project_path)
+
+        assert second.manifest is first.manifest
+
+    def test_reparses_when_file_changes(self, project_path: Path) -> None:
+        """Test that editing manifest.json invalidates the cached parse."""
+        first = MetadataCatalog(project_path)
+
+        manifest = dict(SAMPLE_MANIFEST, exposures={})
+        (project_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+        second = MetadataCatalog(project_path)
+
+        assert second.manifest is not first.manifest
+        assert second.dashboards == {}
+
+    def test_keeps_one_entry_per_path(self, project_path: Path) -> None:
+        """Test that a changed file replaces its stale cache entry."""
+        MetadataCatalog(project_path)
+        size = len(build_metadata_catalog._ARTIFACT_CACHE)
+
+        manifest = dict(SAMPLE_MANIFEST, exposures={})
+        (project_path / "target" / "manifest.json").write_text(json.dumps(manifest))
+        MetadataCatalog(project_path)
+
+        assert len(build_metadata_catalog._ARTIFACT_CACHE) == size
+
+    def test_keeps_only_fields_the_catalog_reads(self, project_path: Path) -> None:
+        """Test that the cached manifest drops non-model nodes and unused fields."""
+        catalog = MetadataCatalog(project_path)
+
+        assert list(catalog.manifest["nodes"]) == [VIEW_ID]
+        assert "compiled_code" not in catalog.manifest["nodes"][VIEW_ID]
+        assert catalog.manifest["metadata"]["dbt_version"] == "1.10.15"
+
+    def test_parses_manifest_from_memory_map(
+        self,
+        project_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that orjson parses a non-empty manifest through _orjson_load."""
+        if build_metadata_catalog.orjson is None:
+            pytest.skip("orjson is not installed")
+        calls = []
+        orjson_load = build_metadata_catalog._orjson_load
+
+        def recording_load(path: Path) -> Any:
+            calls.append(path.name)
+            return orjson_load(path)
+
+        monkeypatch.setattr(build_metadata_catalog, "_orjson_load", recording_load)
+        catalog = MetadataCatalog(project_path)
+
+        assert "manifest.json" in calls
+        assert list(catalog.views) == [VIEW_ID]
+
+    def test_empty_manifest_raises(self, project_path: Path) -> None:
+        """Test that an empty manifest.json fails to parse rather than to map."""
+        (project_path / "target" / "manifest.json").write_text("")
+
+        with pytest.raises(ValueError):
+            MetadataCatalog(project_path)
+
+
+class TestCompiledCatalog:
+    """Tests for the compiled catalog persisted under target/."""
+
+    def test_writes_compiled_catalog(self, project_path: Path) -> None:
+        """Test that building the catalog persists it next to the manifest."""
+        MetadataCatalog(project_path)
+
+        assert (project_path / "target" / build_metadata_catalog.COMPILED_CATALOG_FILENAME).exists()
+
+    def test_loads_without_parsing_manifest(
+        self,
+        project_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a fresh compiled catalog is used instead of the manifests."""
+        first = MetadataCatalog(project_path)
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("manifest should not be parsed")
+
+        monkeypatch.setattr(build_metadata_catalog, "_load_json_artifact", fail)
+        second = MetadataCatalog(project_path)
+
+        assert second.tables == first.tables
+        assert second.views == first.views
+        assert second.reports == first.reports
+        assert second.dashboards == first.dashboards
+        assert second.dbt_version == "1.10.15"
+
+    def test_ignores_corrupt_compiled_catalog(self, project_path: Path) -> None:
+        """Test that an unreadable compiled catalog falls back to a full build."""
+        compiled = project_path / "target" / build_metadata_catalog.COMPILED_CATALOG_FILENAME
+        compiled.write_bytes(b"not json")
+
+        catalog = MetadataCatalog(project_path)
+
+        assert list(catalog.dashboards) == [DASHBOARD_ID]
+
+    def test_rebuilds_after_code_change(
+        self,
+        project_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a catalog compiled by different code is not reused."""
+        MetadataCatalog(project_path)
+        calls = []
+        load = build_metadata_catalog._load_json_artifact
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            calls.append(args)
+            return load(*args, **kwargs)
+
+        monkeypatch.setattr(build_metadata_catalog, "_load_json_artifact", record)
+        monkeypatch.setattr(build_metadata_catalog, "_CODE_FINGERPRINT", "older-parser")
+        catalog = MetadataCatalog(project_path)
+
+        assert calls
+        assert list(catalog.dashboards) == [DASHBOARD_ID]
+
+
+class TestLineageCache:
+    """Tests for memoized dashboard lineage."""
+
+    def test_returns_cached_lineage(self, project_path: Path) -> None:
+        """Test that repeated lineage lookups reuse the first result."""
+        catalog = MetadataCatalog(project_path)
+
+        assert catalog.get_dashboard_lineage(DASHBOARD_ID) is catalog.get_dashboard_lineage(
+            DASHBOARD_ID
+        )
+
+    def test_unknown_dashboard_raises(self, project_path: Path) -> None:
+        """Test that an unknown dashboard still raises ValueError."""
+        catalog = MetadataCatalog(project_path)
+
+        with pytest.raises(ValueError):
+            catalog.get_dashboard_lineage("exposure.bls_data_catalog.missing")
@@ -0,0 +1,362 @@
+"""Unit tests for data_delivery_server.py script."""
+
+import asyncio
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pytest
+
+from bls_data_catalog.scripts import data_delivery_server as server
+
+# Test data fixtures
+VIEW_ID = "model.bls_data_catalog.stg_us_employment"
+REPORT_ID = "semantic_model.bls_data_catalog.us_employment"
+DASHBOARD_ID = "exposure.bls_data_catalog.labor_market_dashboard"
+
+SAMPLE_MANIFEST: dict[str, Any] = {
+    "metadata": {"dbt_version": "1.10.15"},
+    "sources": {},
+    "nodes": {
+        VIEW_ID: {
+            "name": "stg_us_employment",
+            "resource_type": "model",
+            "schema": "analytics",
+            "database": "bls_data",
+            "config": {"materialized": "view"},
+            "depends_on": {"nodes": []},
+        },
+    },
+    "exposures": {
+        DASHBOARD_ID: {
+            "name": "labor_market_dashboard",
+            "type": "dashboard",
+            "url": "https://example.com/dashboards/labor",
+            "owner": {"name": "Analytics"},
+            "maturity": "high",
+            "depends_on": {"nodes": [VIEW_ID]},
+            "meta": {"reports": [REPORT_ID, "semantic_model.bls_data_catalog.missing"]},
+        },
+    },
+}
+
+SAMPLE_SEMANTIC_MANIFEST: dict[str, Any] = {
+    "semantic_models": {
+        REPORT_ID: {
+            "name": "us_employment",
+            "model": "ref('stg_us_employment')",
+            "dimensions": [
+                {"name": "decade", "type": "categorical"},
+                {"name": "year", "type": "categorical"},
+            ],
+            "measures": [
+                {"name": "employed_total", "agg": "sum"},
+                {"name": "unemployed", "agg": "max"},
+            ],
+        },
+    },
+}
+
+SAMPLE_ROWS = [
+    (1940, 1941, 50350, 5560),
+    (1940, 1942, 53750, 2660),
+    (1950, 1953, 61179, 1834),
+    (1950, 1954, 60109, 3532),
+]
+
+
+@pytest.fixture
+def loaded_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    """
+    Point the server's catalog and database at a small test project.
+
+    Args:
+        tmp_path: pytest's temporary directory fixture
+        monkeypatch: pytest's monkeypatch fixture
+
+    Yields:
+        The data_delivery_server module with catalog and db_conn set
+    """
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "manifest.json").write_text(json.dumps(SAMPLE_MANIFEST))
+    (target / "semantic_manifest.json").write_text(json.dumps(SAMPLE_SEMANTIC_MANIFEST))
+
+    db_path = str(tmp_path / "bls_data.duckdb")
+    with duckdb.connect(db_path) as conn:
+        conn.execute("CREATE SCHEMA analytics")
+        conn.execute(
+            "CREATE TABLE analytics.stg_us_employment "
+            "(decade INTEGER, year INTEGER, employed_total INTEGER, unemployed INTEGER)"
+        )
+        conn.executemany(
+            "INSERT INTO analytics.stg_us_employment VALUES (?, ?, ?, ?)",
+            SAMPLE_ROWS,
+        )
+
+    db_conn = duckdb.connect(db_path, read_only=True)
+    monkeypatch.setattr(server, "catalog", server.MetadataCatalog(tmp_path))
+    monkeypatch.setattr(server, "db_conn", db_conn)
+    monkeypatch.setattr(server, "pinned_views", {})
+    server.clear_caches()
+    yield server
+    db_conn.close()
+
+
+class TestCatalogEndpoints:
+    """Tests for endpoints served from the metadata catalog alone."""
+
+    def test_list_dashboards(self, loaded_server: Any) -> None:
+        """Test that dashboards are listed with their report counts."""
+        response = asyncio.run(loaded_server.list_dashboards())
+
+        body = json.loads(response.body)
+        assert response.media_type == "application/json"
+        assert body["count"] == 1
+        assert body["dashboards"][0]["report_count"] == 2
+
+    def test_get_dashboard_skips_unknown_reports(self, loaded_server: Any) -> None:
+        """Test that dashboard metadata only lists reports in the catalog."""
+        response = asyncio.run(loaded_server.get_dashboard(DASHBOARD_ID))
+
+        body = json.loads(response.body)
+        assert body["id"] == DASHBOARD_ID
+        assert [report["id"] for report in body["reports"]] == [REPORT_ID]
+
+    def test_reuses_serialized_response(self, loaded_server: Any) -> None:
+        """Test that a catalog listing is serialized once and then reused."""
+        first = asyncio.run(loaded_server.list_reports())
+        loaded_server.catalog.reports.clear()
+        second = asyncio.run(loaded_server.list_reports())
+
+        assert second.body == first.body
+        assert json.loads(second.body)["reports"][0]["measures"] == [
+            "employed_total",
+            "unemployed",
+        ]
+
+
+class TestGetReportData:
+    """Tests for the report data endpoint."""
+
+    def test_returns_aggregated_rows(self, loaded_server: Any) -> None:
+        """Test that a report query aggregates the first measure by dimension."""
+        response = asyncio.run(
+            loaded_server.get_report_data(
+                REPORT_ID,
+                server.ReportDataRequest(group_by=["decade"]),
+            )
+        )
+
+        rows = sorted(response["data"], key=lambda row: row["decade"])
+        assert rows == [
+            {"decade": 1940, "employed_total": 104100},
+            {"decade": 1950, "employed_total": 121288},
+        ]
+        assert response["row_count"] == 2
+
+    def test_returns_arrow_stream_when_requested(self, loaded_server: Any) -> None:
+        """Test that an Arrow Accept header yields an Arrow IPC stream."""
+        pa = pytest.importorskip("pyarrow")
+
+        response = asyncio.run(
+            loaded_server.get_report_data(
+                REPORT_ID,
+                server.ReportDataRequest(group_by=["decade"]),
+                accept=server.ARROW_STREAM_MEDIA_TYPE,
+            )
+        )
+
+        assert response.media_type == server.ARROW_STREAM_MEDIA_TYPE
+        assert response.headers["X-Row-Count"] == "2"
+        table = pa.ipc.open_stream(response.body).read_all()
+        assert table.column_names == ["decade", "employed_total"]
+
+
+class TestBuildReportQuery:
+    """Tests for report SQL generation."""
+
+    def test_binds_filter_values_as_parameters(self, loaded_server: Any) -> None:
+        """Test that client-supplied filter values never appear in the SQL text."""
+        report = loaded_server.catalog.get_report(REPORT_ID)
+        request = server.ReportDataRequest(
+            group_by=["decade"],
+            filters=server.ReportFilter(dimensions={"year": ["1941' OR '1'='1"]}, limit=5),
+        )
+
+        sql, params = loaded_server.build_report_query(report, request)
+
+        assert "1941" not in sql
+        assert params == ["1941' OR '1'='1", 5]
+
+    def test_groups_by_all_default_dimensions(self, loaded_server: Any) -> None:
+        """Test that the default query groups by every selected dimension."""
+        response = asyncio.run(loaded_server.get_report_data(REPORT_ID, server.ReportDataRequest()))
+
+        assert response["row_count"] == len(SAMPLE_ROWS)
+
+    @pytest.mark.parametrize(
+        "request_body",
+        [
+            {"group_by": ["decade; DROP TABLE analytics.stg_us_employment"]},
+            {"metrics": ["employed_total) FROM pg_catalog --"]},
+            {"filters": {"dimensions": {"1=1 OR year": ["1941"]}}},
+        ],
+    )
+    def test_rejects_unknown_fields(self, loaded_server: Any, request_body: dict) -> None:
+        """Test that identifiers outside the semantic model are rejected with 400."""
+        with pytest.raises(server.HTTPException) as exc_info:
+            asyncio.run(
+                loaded_server.get_report_data(
+                    REPORT_ID,
+                    server.ReportDataRequest(**request_body),
+                )
+            )
+
+        assert exc_info.value.status_code == 400
+
+    def test_caps_rows_at_max_rows(
+        self,
+        loaded_server: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that results past MAX_ROWS are cut off and flagged as truncated."""
+        monkeypatch.setattr(loaded_server, "MAX_ROWS", 2)
+
+        response = asyncio.run(
+            loaded_server.get_report_data(
+                REPORT_ID,
+                server.ReportDataRequest(filters=server.ReportFilter(limit=100)),
+            )
+        )
+
+        assert response["params"] == [3]
+        assert response["row_count"] == 2
+        assert response["truncated"] is True
+
+    def test_builds_report_template_once(
+        self,
+        loaded_server: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the per-report SQL template is reused across requests."""
+        report = loaded_server.catalog.get_report(REPORT_ID)
+        calls = []
+        build = loaded_server.build_report_template
+
+        def counting_build(report: Any) -> Any:
+            calls.append(report.id)
+            return build(report)
+
+        monkeypatch.setattr(loaded_server, "build_report_template", counting_build)
+        loaded_server.build_report_query(report, server.ReportDataRequest(group_by=["decade"]))
+        loaded_server.build_report_query(report, server.ReportDataRequest(group_by=["year"]))
+
+        assert calls == [REPORT_ID]
+
+
+class TestPinnedViews:
+    """Tests for copying small report views into memory."""
+
+    def test_queries_read_pinned_copy(self, loaded_server: Any) -> None:
+        """Test that a pinned view is queried from the in-memory database."""
+        pinned = loaded_server.pin_report_views()
+
+        response = asyncio.run(loaded_server.get_report_data(REPORT_ID, server.ReportDataRequest()))
+
+        assert list(pinned) == ["analytics.stg_us_employment"]
+        assert f"FROM {server.PINNED_DATABASE}." in response["sql"]
+        assert response["row_count"] == len(SAMPLE_ROWS)
+
+    def test_drops_queries_built_before_pinning(self, loaded_server: Any) -> None:
+        """Test that SQL cached before pinning is rebuilt against the pinned copy."""
+        request = server.ReportDataRequest(group_by=["decade"])
+        before = asyncio.run(loaded_server.get_report_data(REPORT_ID, request))
+
+        loaded_server.pin_report_views()
+        after = asyncio.run(loaded_server.get_report_data(REPORT_ID, request))
+
+        assert "FROM analytics." in before["sql"]
+        assert f"FROM {server.PINNED_DATABASE}." in after["sql"]
+        assert sorted(after["data"], key=lambda row: row["decade"]) == sorted(
+            before["data"], key=lambda row: row["decade"]
+        )
+
+    def test_skips_views_over_row_limit(self, loaded_server: Any) -> None:
+        """Test that views larger than max_rows are left on disk."""
+        pinned = loaded_server.pin_report_views(max_rows=len(SAMPLE_ROWS) - 1)
+
+        assert pinned == {}
+
+    def test_attach_failure_leaves_views_on_disk(
+        self,
+        loaded_server: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failed in-memory attach falls back to the on-disk views."""
+        monkeypatch.setattr(loaded_server, "PINNED_DATABASE", "temp")
+
+        pinned = loaded_server.pin_report_views()
+        response = asyncio.run(loaded_server.get_report_data(REPORT_ID, server.ReportDataRequest()))
+
+        assert pinned == {}
+        assert "FROM analytics." in response["sql"]
+
+
+class TestReportCaches:
+    """Tests for the report SQL and result caches."""
+
+    def test_repeated_request_reuses_result(
+        self,
+        loaded_server: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an identical request is answered without re-querying."""
+        request = server.ReportDataRequest(group_by=["decade"])
+        first = asyncio.run(loaded_server.get_report_data(REPORT_ID, request))
+
+        def fail(sql: str, params: Any) -> None:
+            raise AssertionError("query should be served from cache")
+
+        monkeypatch.setattr(loaded_server, "run_query", fail)
+        second = asyncio.run(loaded_server.get_report_data(REPORT_ID, request))
+
+        assert second["data"] == first["data"]
+
+    def test_lru_cache_evicts_least_recently_used(self) -> None:
+        """Test that the LRU cache keeps at most maxsize entries."""
+        cache = server.LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_lru_cache_expires_entries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that entries older than the TTL are dropped."""
+        now = [100.0]
+        monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+        cache = server.LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        now[0] += 61
+
+        assert cache.get("a") is None
+
+
+class TestGetAllDashboardData:
+    """Tests for the dashboard data fan-out endpoint."""
+
+    def test_collects_results_and_errors_per_report(self, loaded_server: Any) -> None:
+        """Test that every report gets either its data or its error."""
+        response = asyncio.run(loaded_server.get_all_dashboard_data(DASHBOARD_ID))
+
+        reports = response["reports"]
+        assert set(reports) == {REPORT_ID, "semantic_model.bls_data_catalog.missing"}
+        assert reports[REPORT_ID]["row_count"] == len(SAMPLE_ROWS)
+        assert "404" in reports["semantic_model.bls_data_catalog.missing"]["error"]